@@ -1,15 +1,203 @@
 # cli_agent.py
 
 import os
+import re
+import sys
+import queue
 import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import QueueHandler, QueueListener
 import json
-from typing import Optional, Any
+import hashlib
+import time
+import datetime
+from functools import lru_cache
+from typing import Optional, Any, AsyncIterator, Dict, List, Tuple
+import orjson
+from pydantic import BaseModel, TypeAdapter, ValidationError
 import google.generativeai as genai
+from google.generativeai import caching
 from mcp_client import SlackMCPClientWithLLM
 from dotenv import load_dotenv
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# Static planner instructions; sent once as the system instruction (or
+# context cache) instead of being repeated in every planning prompt
+PLANNER_INSTRUCTIONS = """
+You are a Slack assistant.
+Available tools (latest from MCP server):
+{tool_summary_json}
+
+Return a JSON plan in this exact format (no extra text):
+{{
+  "actions": [
+    {{
+      "tool": "<tool_name>",
+      "args": {{"param": "value"}},
+      "save_as": "<optional_context_name>"
+    }}
+  ],
+  "response": "<final text to show user with ACTUAL DATA, not templates>",
+  "done": true
+}}
+
+CRITICAL RULES:
+1. ALWAYS return valid JSON, nothing else
+2. When showing data to user in "response", use the ACTUAL values from context, NOT template syntax like {{{{variable}}}}
+3. Format lists as plain text like "• Channel1\\n• Channel2" NOT templates
+4. If you need data, first fetch it with a tool action, then in the next iteration use that data
+5. Use $context_name (the action's save_as) to reference extracted tool results
+6. For channel names in args, use just the name without # (e.g., "social" not "#social")
+7. For threads, the thread_ts is in the format like "1234567890.123456"
+"""
+
+PLANNER_CACHE_TTL = datetime.timedelta(hours=1)
+# The planner cache is renewed when less than this much of its TTL is left
+PLANNER_CACHE_RENEW_MARGIN = datetime.timedelta(minutes=10)
+# Gemini rejects cached content below a minimum token count (1024 for the
+# Flash models); shorter planner prefixes skip the cache. Tokens are
+# estimated at PLANNER_CHARS_PER_TOKEN characters each
+PLANNER_CACHE_MIN_TOKENS = 1024
+PLANNER_CHARS_PER_TOKEN = 4
+
+# Tools with side effects in Slack; they are never started while a plan is
+# still streaming, and run one at a time in plan order
+WRITE_TOOLS = frozenset({"post_message", "reply_to_thread"})
+
+# Maximum number of user queries planned together in one Gemini call
+MAX_BATCH_QUERIES = 8
+
+# Directory for cached one-shot Gemini replies; off unless GEMINI_CACHE=1.
+# Entries older than GEMINI_CACHE_TTL seconds are ignored and removed
+GEMINI_CACHE_DIR = ".gemini_cache"
+GEMINI_CACHE_TTL = 24 * 60 * 60
+
+# Context sent to Gemini is compacted once its JSON exceeds this many bytes;
+# lists longer than CONTEXT_LIST_LIMIT items or values larger than
+# CONTEXT_VALUE_LIMIT bytes are then replaced with a short summary
+CONTEXT_JSON_LIMIT = 8 * 1024
+CONTEXT_VALUE_LIMIT = 2 * 1024
+CONTEXT_LIST_LIMIT = 10
+CONTEXT_SAMPLE_SIZE = 3
+
+# Optional ```json fences around a Gemini reply; the closing fence may be
+# missing when a response is cut off
+_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*(.*?)\s*(?:```)?\s*$", re.DOTALL)
+_ACTIONS_START_RE = re.compile(r'"actions"\s*:\s*\[')
+
+
+@lru_cache(maxsize=512)
+def _parse_ref(ref: str) -> Tuple[Any, ...]:
+    """
+    Split a reference like $threads[0].replies[0].text into its path parts,
+    with list indices already converted to ints
+    """
+    parts = ref[1:].replace("]", "").replace("[", ".").split(".")
+    return tuple(int(p) if p.isdigit() else p for p in parts)
+
+
+def _maybe_json(text: Any) -> Any:
+    """
+    Parse text as JSON when it looks like a JSON object or array, otherwise
+    return it unchanged without paying for a failed parse
+    """
+    if isinstance(text, str) and len(text) >= 2 and text[0] in "{[" and text[-1] in "}]":
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return text
+
+
+def _compact_value(value: Any) -> Any:
+    """
+    Return a compact view of a context value for the LLM prompt, replacing
+    large lists with a summary plus a small sample and truncating long strings
+    """
+    if isinstance(value, dict):
+        return {k: _compact_value(v) for k, v in value.items()}
+    if isinstance(value, list):
+        if (
+            len(value) > CONTEXT_LIST_LIMIT
+            or len(orjson.dumps(value, default=str)) > CONTEXT_VALUE_LIMIT
+        ):
+            keys = sorted({k for item in value if isinstance(item, dict) for k in item})
+            summary = f"{len(value)} items"
+            if keys:
+                summary += f", keys=[{','.join(map(str, keys))}]"
+            return {
+                "__summary__": summary,
+                "sample": [_compact_value(v) for v in value[:CONTEXT_SAMPLE_SIZE]],
+            }
+        return [_compact_value(v) for v in value]
+    if isinstance(value, str) and len(value) > CONTEXT_VALUE_LIMIT:
+        return value[:CONTEXT_VALUE_LIMIT] + f"... [{len(value)} chars total]"
+    return value
+
+
+class PlanAction(BaseModel):
+    """One tool call in a Gemini plan"""
+
+    tool: str
+    args: Optional[Dict[str, Any]] = None
+    save_as: Optional[str] = None
+
+
+class Plan(BaseModel):
+    """A Gemini plan: tool calls to run, text to show, and whether it is final"""
+
+    actions: List[PlanAction] = []
+    response: Optional[str] = None
+    done: bool = True
+
+
+# Plans are validated straight from JSON text by pydantic-core
+_PLANS_ADAPTER = TypeAdapter(List[Plan])
+
+
+class PlanStreamParser:
+    """
+    Incrementally extract completed action objects from a streamed JSON plan.
+    """
+
+    def __init__(self):
+        self._buffer = ""
+        self._pos: Optional[int] = None  # next unread index inside the actions array
+        self._closed = False
+        self._decoder = json.JSONDecoder()
+
+    def feed(self, text: str) -> List[dict]:
+        """Add streamed text and return the actions completed by it"""
+        self._buffer += text
+        actions = []
+        if self._pos is None:
+            m = _ACTIONS_START_RE.search(self._buffer)
+            if not m:
+                return actions
+            self._pos = m.end()
+
+        while not self._closed:
+            i = self._pos
+            while i < len(self._buffer) and self._buffer[i] in " \t\r\n,":
+                i += 1
+            self._pos = i
+            if i >= len(self._buffer):
+                break
+            if self._buffer[i] == "]":
+                self._closed = True
+                break
+            try:
+                action, self._pos = self._decoder.raw_decode(self._buffer, i)
+            except json.JSONDecodeError:
+                break  # object not complete yet
+            if isinstance(action, dict):
+                actions.append(action)
+        return actions
+
 
 class GeminiSlackAgent:
     """
@@ -21,24 +209,185 @@ class GeminiSlackAgent:
         if not api_key:
             raise ValueError("Set GOOGLE_API_KEY environment variable first.")
         genai.configure(api_key=api_key)
+        self.model_name = model_name
         self.model = genai.GenerativeModel(model_name)
+        self.planner_model: Optional[genai.GenerativeModel] = None
+        self._planner_cache: Optional[caching.CachedContent] = None
+        self._planner_cache_deadline = 0.0  # time.monotonic() when it expires
+        self._planner_tools_json: Optional[str] = None
         self.mcp_client: Optional[SlackMCPClientWithLLM] = None
         self.running = True
         self.context: dict = {}  # store intermediate tool outputs
+        self._context_json_cache: Optional[str] = None
+        self._context_dirty = True
+        self._context_updates: dict = {}  # entries stored since the last planner message
+        self._llm_cache_dir: Optional[str] = (
+            GEMINI_CACHE_DIR if os.environ.get("GEMINI_CACHE") == "1" else None
+        )
 
     async def connect_mcp(self):
         self.mcp_client = SlackMCPClientWithLLM(agent=self)
         await self.mcp_client.connect()
         print("✅ Connected to MCP server")
+        self.build_planner_model(await self.mcp_client.get_tool_list_summary_json())
+
+    def build_planner_model(self, tool_summary_json: str):
+        """
+        Build the planning model with the static instructions and tool list
+        stored in a Gemini context cache (when long enough to be cached), so
+        each planning call only sends the user question and current context.
+        """
+        self.clear_planner_cache()
+        instructions = PLANNER_INSTRUCTIONS.format(tool_summary_json=tool_summary_json)
+        self._planner_tools_json = tool_summary_json
+        # A system instruction still keeps the static prefix out of the
+        # per-call prompt when the prefix is too short to cache
+        fallback = genai.GenerativeModel(
+            self.model_name, system_instruction=instructions
+        )
+        if len(instructions) < PLANNER_CACHE_MIN_TOKENS * PLANNER_CHARS_PER_TOKEN:
+            logger.debug("Planner prefix below the context cache minimum, not caching")
+            self.planner_model = fallback
+            return
+        try:
+            self._planner_cache = caching.CachedContent.create(
+                model=self.model_name,
+                display_name="slack-agent-planner",
+                system_instruction=instructions,
+                ttl=PLANNER_CACHE_TTL,
+            )
+            self._planner_cache_deadline = (
+                time.monotonic() + PLANNER_CACHE_TTL.total_seconds()
+            )
+            self.planner_model = genai.GenerativeModel.from_cached_content(
+                self._planner_cache
+            )
+        except Exception as e:
+            # Context caching is not available for every model
+            logger.info("Context cache unavailable, using system instruction: %s", e)
+            self.planner_model = fallback
+
+    async def stream_gemini(
+        self,
+        prompt: str,
+        model: Optional[genai.GenerativeModel] = None,
+        chat: Optional[genai.ChatSession] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Send prompt to Gemini (or the given model, or as the next message of
+        the given chat) and yield text chunks as they arrive
+        """
+        try:
+            if chat:
+                response = await chat.send_message_async(prompt, stream=True)
+            else:
+                response = await (model or self.model).generate_content_async(
+                    prompt, stream=True
+                )
+            async for chunk in response:
+                yield chunk.text
+        except Exception as e:
+            yield f"[Gemini Error] {str(e)}"
+
+    def clear_planner_cache(self):
+        """Delete the planner context cache, if one was created"""
+        if self._planner_cache:
+            try:
+                self._planner_cache.delete()
+            except Exception as e:
+                logger.info("Failed to delete context cache: %s", e)
+            self._planner_cache = None
+
+    def ask_gemini(
+        self,
+        prompt: str,
+        model: Optional[genai.GenerativeModel] = None,
+        store: bool = True,
+    ) -> str:
+        """
+        Send prompt to Gemini (or the given model) and return text.
+        With store=False a fresh reply is not cached; the caller stores it
+        with cache_reply once it has checked the reply is usable.
+        """
+        model = model or self.model
+        cached = self.cached_reply(prompt, model)
+        if cached is not None:
+            return cached
 
-    def ask_gemini(self, prompt: str) -> str:
-        """Send prompt to Gemini and return text"""
         try:
-            response = self.model.generate_content(prompt)
-            return response.text.strip()
+            response = model.generate_content(prompt)
+            text = response.text.strip()
         except Exception as e:
             return f"[Gemini Error] {str(e)}"
 
+        if store:
+            self.cache_reply(prompt, model, text)
+        return text
+
+    async def ask_gemini_async(
+        self,
+        prompt: str,
+        model: Optional[genai.GenerativeModel] = None,
+        store: bool = True,
+    ) -> str:
+        """ask_gemini without blocking the event loop during the Gemini call"""
+        model = model or self.model
+        cached = self.cached_reply(prompt, model)
+        if cached is not None:
+            return cached
+
+        try:
+            response = await model.generate_content_async(prompt)
+            text = response.text.strip()
+        except Exception as e:
+            return f"[Gemini Error] {str(e)}"
+
+        if store:
+            self.cache_reply(prompt, model, text)
+        return text
+
+    def cached_reply(self, prompt: str, model: genai.GenerativeModel) -> Optional[str]:
+        """Return the cached reply for a prompt, or None if missing or expired"""
+        cache_path = self.gemini_cache_path(prompt, model)
+        if not cache_path:
+            return None
+        try:
+            if time.time() - os.path.getmtime(cache_path) < GEMINI_CACHE_TTL:
+                with open(cache_path, encoding="utf-8") as f:
+                    return f.read()
+            os.remove(cache_path)  # expired
+        except OSError:
+            pass  # no entry yet
+        return None
+
+    def cache_reply(self, prompt: str, model: genai.GenerativeModel, text: str):
+        """Store a Gemini reply for ask_gemini to reuse, if caching is enabled"""
+        cache_path = self.gemini_cache_path(prompt, model)
+        if not cache_path or os.path.exists(cache_path):
+            return  # disabled, or already cached (a replayed reply keeps its age)
+        try:
+            os.makedirs(self._llm_cache_dir, exist_ok=True)
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning("Could not write Gemini cache entry: %s", e)
+
+    def gemini_cache_path(self, prompt: str, model: genai.GenerativeModel) -> Optional[str]:
+        """
+        Path of the cached reply for a prompt, keyed by the model name and,
+        for the planner, the tool list baked into its instructions
+        """
+        if not self._llm_cache_dir:
+            return None
+        key = hashlib.blake2b(digest_size=16)
+        key.update(self.model_name.encode())
+        if model is self.planner_model and self._planner_tools_json:
+            key.update(self._planner_tools_json.encode())
+        key.update(prompt.encode())
+        return os.path.join(self._llm_cache_dir, f"{key.hexdigest()}.txt")
+
     def resolve_reference(self, ref: str) -> Any:
         """
         Resolve a reference string like $threads[0].replies[0].text
@@ -46,15 +395,17 @@ class GeminiSlackAgent:
         if not ref.startswith("$"):
             return ref
 
-        ref = ref[1:]  # remove $
-        parts = ref.replace("]", "").replace("[", ".").split(".")
+        parts = _parse_ref(ref)
         value = self.context.get(parts[0])
+        if value is None and isinstance(parts[0], str):
+            # Accept the older $name_data form of a reference
+            value = self.context.get(parts[0].removesuffix("_data"))
         if value is None:
-            raise ValueError(f"Reference {ref} not found in context")
+            raise ValueError(f"Reference {ref[1:]} not found in context")
 
         for part in parts[1:]:
-            if part.isdigit():
-                value = value[int(part)]
+            if isinstance(part, int):
+                value = value[part]
             else:
                 # Handle both dict and object attributes
                 if isinstance(value, dict):
@@ -75,11 +426,7 @@ class GeminiSlackAgent:
                 extracted = []
                 for item in result.content:
                     if hasattr(item, 'text'):
-                        # Try to parse as JSON first
-                        try:
-                            extracted.append(json.loads(item.text))
-                        except (json.JSONDecodeError, TypeError):
-                            extracted.append(item.text)
+                        extracted.append(_maybe_json(item.text))
                     elif hasattr(item, 'model_dump'):
                         extracted.append(item.model_dump())
                     else:
@@ -87,168 +434,361 @@ class GeminiSlackAgent:
                 return extracted[0] if len(extracted) == 1 else extracted
             # Handle single content item
             elif hasattr(result.content, 'text'):
-                try:
-                    return json.loads(result.content.text)
-                except (json.JSONDecodeError, TypeError):
-                    return result.content.text
+                return _maybe_json(result.content.text)
             else:
                 return str(result.content)
         return result
 
     def serialize_context(self) -> str:
         """
-        Serialize context to JSON-safe format, handling MCP CallToolResult objects
-        """
-        def make_serializable(obj):
-            """Convert objects to JSON-serializable format"""
-            if hasattr(obj, 'content'):
-                return self.extract_tool_result_content(obj)
-            elif isinstance(obj, dict):
-                return {k: make_serializable(v) for k, v in obj.items()}
-            elif isinstance(obj, list):
-                return [make_serializable(item) for item in obj]
-            elif hasattr(obj, 'model_dump'):
-                return obj.model_dump()
-            elif hasattr(obj, '__dict__'):
-                return str(obj)
-            else:
-                return obj
-        
-        serializable_context = make_serializable(self.context)
-        return json.dumps(serializable_context, indent=2, default=str)
+        Serialize the extracted tool results in context to JSON, memoized
+        until the context changes. Large contexts are compacted for the
+        prompt; references still resolve against the full self.context.
+        """
+        if self._context_dirty:
+            context_json = orjson.dumps(
+                self.context, option=orjson.OPT_NON_STR_KEYS, default=str
+            )
+            if len(context_json) > CONTEXT_JSON_LIMIT:
+                context_json = orjson.dumps(
+                    _compact_value(self.context),
+                    option=orjson.OPT_NON_STR_KEYS,
+                    default=str,
+                )
+            self._context_json_cache = context_json.decode()
+            self._context_dirty = False
+        return self._context_json_cache
+
+    def serialize_context_updates(self) -> str:
+        """
+        Serialize the context entries stored since the last call, compacted
+        only when their JSON exceeds CONTEXT_JSON_LIMIT (as in serialize_context)
+        """
+        updates = self._context_updates
+        self._context_updates = {}
+        updates_json = orjson.dumps(
+            updates, option=orjson.OPT_NON_STR_KEYS, default=str
+        )
+        if len(updates_json) > CONTEXT_JSON_LIMIT:
+            updates_json = orjson.dumps(
+                _compact_value(updates), option=orjson.OPT_NON_STR_KEYS, default=str
+            )
+        return updates_json.decode()
 
-    async def execute_plan(self, plan_json: str) -> bool:
+    def references_plan_output(self, action: PlanAction, plan_outputs: set) -> bool:
+        """
+        Check whether an action's args reference a save_as produced in the same plan
+        """
+        for v in (action.args or {}).values():
+            if isinstance(v, str) and v.startswith("$"):
+                name = str(_parse_ref(v)[0])
+                if name in plan_outputs or name.removesuffix("_data") in plan_outputs:
+                    return True
+        return False
+
+    async def call_action(self, action: PlanAction) -> Any:
+        """Resolve $context references in an action's args and call its MCP tool"""
+        return await self.mcp_client.call_tool(*self.prepare_action(action))
+
+    def prepare_action(self, action: PlanAction) -> Tuple[str, dict]:
+        """Resolve $context references in an action's args, returning (tool, args)"""
+        tool = action.tool
+        args = dict(action.args or {})
+
+        print(f"[Debug] Calling tool: {tool} with args: {args}")
+
+        # Resolve $context references
+        for k, v in args.items():
+            if isinstance(v, str) and v.startswith("$"):
+                try:
+                    args[k] = self.resolve_reference(v)
+                    print(f"[Debug] Resolved ${v} to: {args[k]}")
+                except Exception as e:
+                    print(f"[Error] {e}")
+                    args[k] = None
+
+        return tool, args
+
+    def store_action_result(self, action: PlanAction, result: Any):
+        """Save a tool result (or report its failure) under the action's save_as"""
+        tool = action.tool
+        save_as = action.save_as
+
+        if isinstance(result, Exception):
+            print(f"[Error calling tool {tool}]: {result}")
+            logger.error("tool call failed: %s", tool, exc_info=result)
+            return
+
+        print(f"[Debug] Tool result: {result}")
+
+        # Store only the extracted content; the raw result is never read again
+        if save_as:
+            self.context[save_as] = self.extract_tool_result_content(result)
+            self._context_updates[save_as] = self.context[save_as]
+            self._context_dirty = True
+            print(f"[Debug] Saved to context['{save_as}'] = {self.context[save_as]}")
+
+    async def stream_plan(
+        self, prompt: str, chat: Optional[genai.ChatSession] = None
+    ) -> bool:
+        """
+        Stream a plan from the planner model (or planner chat) and start each independent tool
+        call as soon as its action object is complete, overlapping Gemini's
+        decoding with MCP I/O. Dispatching stops at the first write tool.
+        Returns True if plan indicates done, False if more steps required.
+        """
+        parser = PlanStreamParser()
+        plan_outputs = set()
+        dispatched: List[Tuple[PlanAction, asyncio.Task]] = []
+        blocked = False  # set once an action is invalid or depends on this plan's outputs
+        chunks = []
+
+        async for text in self.stream_gemini(prompt, model=self.planner_model, chat=chat):
+            chunks.append(text)
+            for obj in parser.feed(text):
+                if blocked:
+                    continue
+                try:
+                    action = PlanAction.model_validate(obj)
+                except ValidationError:
+                    blocked = True  # left for the full plan validation to report
+                    continue
+                if action.tool in WRITE_TOOLS or self.references_plan_output(
+                    action, plan_outputs
+                ):
+                    # Writes wait until the whole plan has validated
+                    blocked = True
+                    continue
+                task = asyncio.create_task(self.call_action(action))
+                dispatched.append((action, task))
+                if action.save_as:
+                    plan_outputs.add(action.save_as)
+
+        return await self.execute_plan("".join(chunks), dispatched)
+
+    async def execute_plan(
+        self,
+        plan_json: str,
+        dispatched: Optional[List[Tuple[PlanAction, asyncio.Task]]] = None,
+    ) -> bool:
         """
         Execute a JSON plan returned by Gemini.
+        dispatched holds (action, task) pairs for the leading actions whose
+        tool calls were already started while the plan was streaming.
         Returns True if plan indicates done, False if more steps required.
         """
-        # Strip markdown code blocks if present
-        plan_json = plan_json.strip()
-        if plan_json.startswith("```json"):
-            plan_json = plan_json[7:]  # remove ```json
-        elif plan_json.startswith("```"):
-            plan_json = plan_json[3:]  # remove ```
-        
-        if plan_json.endswith("```"):
-            plan_json = plan_json[:-3]  # remove trailing ```
-        
-        plan_json = plan_json.strip()
+        plan_json = self.strip_code_fence(plan_json)
         
         # Check if response is just text (no JSON)
         if not plan_json or not plan_json.startswith('{'):
             print(f"[Info] Gemini responded with text only: {plan_json}")
+            await self.run_actions(dispatched or [], [])
             return False  # continue conversation
         
         try:
-            plan = json.loads(plan_json)
-        except json.JSONDecodeError as e:
+            plan = Plan.model_validate_json(plan_json)
+        except ValidationError as e:
             print(f"[Error] Failed to parse Gemini plan: {e}")
             print("Raw response:")
             print(plan_json)
+            await self.run_actions(dispatched or [], [])
             return True  # stop if invalid JSON
 
-        actions = plan.get("actions", [])
-        done = plan.get("done", True)  # default True
-        
-        for action in actions:
-            tool = action.get("tool")
-            args = action.get("args", {})
-            save_as = action.get("save_as")
-
-            print(f"[Debug] Calling tool: {tool} with args: {args}")
-
-            # Resolve $context references
-            for k, v in args.items():
-                if isinstance(v, str) and v.startswith("$"):
-                    try:
-                        args[k] = self.resolve_reference(v)
-                        print(f"[Debug] Resolved ${v} to: {args[k]}")
-                    except Exception as e:
-                        print(f"[Error] {e}")
-                        args[k] = None
-
-            # Call the MCP tool
+        return await self.run_plan(plan, dispatched)
+
+    def strip_code_fence(self, text: str) -> str:
+        """Strip markdown code blocks if present"""
+        m = _FENCE_RE.match(text)
+        return (m.group(1) if m else text).strip()
+
+    async def run_plan(
+        self,
+        plan: Plan,
+        dispatched: Optional[List[Tuple[PlanAction, asyncio.Task]]] = None,
+    ) -> bool:
+        """
+        Run the actions of a parsed plan and print its response.
+        Returns True if plan indicates done, False if more steps required.
+        """
+        dispatched = dispatched or []
+        actions = plan.actions
+
+        await self.run_actions(dispatched, actions[len(dispatched):], actions)
+
+        # Print final response
+        if plan.response:
+            print(f"\n{plan.response}\n")
+        return plan.done
+
+    async def run_actions(
+        self,
+        dispatched: List[Tuple[PlanAction, asyncio.Task]],
+        actions: List[PlanAction],
+        plan_actions: Optional[List[PlanAction]] = None,
+    ):
+        """
+        Await already dispatched tool calls and run the remaining actions,
+        storing every result in the original action order.
+        """
+        # Actions up to the first write or the first one that references
+        # another action's save_as in this same plan only read and only
+        # depend on earlier iterations, so their tool calls can be issued
+        # concurrently
+        plan_outputs = {a.save_as for a in plan_actions or actions if a.save_as}
+        split = next(
+            (
+                i
+                for i, action in enumerate(actions)
+                if action.tool in WRITE_TOOLS
+                or self.references_plan_output(action, plan_outputs)
+            ),
+            len(actions),
+        )
+        independent, dependent = actions[:split], actions[split:]
+
+        calls = [self.prepare_action(action) for action in independent]
+        dispatched_results, batch_results = await asyncio.gather(
+            asyncio.gather(*(task for _, task in dispatched), return_exceptions=True),
+            self.mcp_client.call_tools_batch(calls),
+        )
+        results = dispatched_results + batch_results
+        started = [action for action, _ in dispatched] + independent
+        for action, result in zip(started, results):
+            self.store_action_result(action, result)
+
+        # Writes and dependent actions run in order, so posts land in plan
+        # order and each action sees the results before it
+        for action in dependent:
             try:
-                result = await self.mcp_client.call_tool(tool, args)
-                print(f"[Debug] Tool result: {result}")
-                
-                # Store result and extract content
-                if save_as:
-                    self.context[save_as] = result
-                    # Also store the extracted content
-                    extracted = self.extract_tool_result_content(result)
-                    self.context[f"{save_as}_data"] = extracted
-                    print(f"[Debug] Saved to context['{save_as}_data'] = {extracted}")
-                            
+                result = await self.call_action(action)
             except Exception as e:
-                print(f"[Error calling tool {tool}]: {e}")
-                import traceback
-                traceback.print_exc()
+                result = e
+            self.store_action_result(action, result)
 
-        # Print final response
-        final_response = plan.get("response")
-        if final_response:
-            print(f"\n{final_response}\n")
-        return done
+    async def refresh_planner(self):
+        """
+        Rebuild the planner if the tool list changed, and renew its context
+        cache before the TTL lapses
+        """
+        tool_summary_json = await self.mcp_client.get_tool_list_summary_json()
+        if tool_summary_json != self._planner_tools_json:
+            self.build_planner_model(tool_summary_json)
+        elif self._planner_cache and (
+            self._planner_cache_deadline - time.monotonic()
+            < PLANNER_CACHE_RENEW_MARGIN.total_seconds()
+        ):
+            self.renew_planner_cache()
+
+    def renew_planner_cache(self):
+        """
+        Extend the planner context cache by another PLANNER_CACHE_TTL; if
+        that fails (e.g. it already expired), build the planner again
+        """
+        try:
+            self._planner_cache.update(ttl=PLANNER_CACHE_TTL)
+            self._planner_cache_deadline = (
+                time.monotonic() + PLANNER_CACHE_TTL.total_seconds()
+            )
+        except Exception as e:
+            logger.info("Failed to renew context cache, rebuilding: %s", e)
+            self.build_planner_model(self._planner_tools_json)
 
     async def handle_user_input(self, user_input: str):
         """Automatically plan and execute tool usage for the user query"""
         if not self.mcp_client:
             raise RuntimeError("MCP client not connected")
 
-        # Step 1: Get tool list dynamically for Gemini
-        tool_summary = await self.mcp_client.get_tool_list_summary()
-        tool_summary_json = json.dumps(tool_summary, indent=2)
+        await self.refresh_planner()
+
+        # One planner chat per user turn: the first message carries the
+        # question and context, later ones only the newly stored results
+        chat = self.planner_model.start_chat()
+        self._context_updates = {}
+        message = f"""
+The user asked: "{user_input}".
+
+Current context from previous tool calls:
+{self.serialize_context()}
+"""
 
         # Iterative reasoning loop
         done = False
         iteration = 0
         while not done and iteration < 5:  # limit iterations to prevent infinite loop
             iteration += 1
-            
-            # Serialize context safely
+            print(f"\n[Iteration {iteration}]")
+            done = await self.stream_plan(message, chat=chat)
+            message = f"""
+Results of the last actions:
+{self.serialize_context_updates()}
+"""
+
+    async def handle_user_inputs(self, queries: List[str]):
+        """
+        Plan several independent user queries together, one Gemini call per
+        iteration for up to MAX_BATCH_QUERIES queries at a time
+        """
+        if not self.mcp_client:
+            raise RuntimeError("MCP client not connected")
+
+        for start in range(0, len(queries), MAX_BATCH_QUERIES):
+            await self.refresh_planner()
+            await self.handle_query_batch(queries[start:start + MAX_BATCH_QUERIES])
+
+    async def handle_query_batch(self, queries: List[str]):
+        """Iteratively plan and execute a batch of queries until all are done"""
+        pending = list(enumerate(queries, 1))  # keep numbering stable across iterations
+        iteration = 0
+        while pending and iteration < 5:  # limit iterations to prevent infinite loop
+            iteration += 1
+
             context_json = self.serialize_context()
-            
+            numbered = "\n".join(f'{i}. "{q}"' for i, q in pending)
+
             prompt = f"""
-You are a Slack assistant. The user asked: "{user_input}".
-Available tools (latest from MCP server):
-{tool_summary_json}
+You will be given {len(pending)} independent user questions. For each return a plan object in order, wrapped in a top-level JSON array.
+Prefix every save_as name with its question number (e.g., "q1_channels") so results do not collide.
+
+The user asked:
+{numbered}
 
 Current context from previous tool calls:
 {context_json}
+"""
+            print(f"\n[Batch iteration {iteration}]")
+            reply = await self.ask_gemini_async(
+                prompt, model=self.planner_model, store=False
+            )
+            plans_json = self.strip_code_fence(reply)
+            try:
+                plans = _PLANS_ADAPTER.validate_json(plans_json)
+            except ValidationError as e:
+                print(f"[Error] Failed to parse Gemini plans: {e}")
+                print("Raw response:")
+                print(plans_json)
+                return
 
-Return a JSON plan in this exact format (no extra text):
-{{
-  "actions": [
-    {{
-      "tool": "<tool_name>",
-      "args": {{"param": "value"}},
-      "save_as": "<optional_context_name>"
-    }}
-  ],
-  "response": "<final text to show user with ACTUAL DATA, not templates>",
-  "done": true
-}}
+            if len(plans) != len(pending):
+                print(f"[Error] Expected a JSON array of {len(pending)} plans")
+                print("Raw response:")
+                print(plans_json)
+                return
+            # Only plans that validated are worth replaying
+            self.cache_reply(prompt, self.planner_model, reply)
 
-CRITICAL RULES:
-1. ALWAYS return valid JSON, nothing else
-2. When showing data to user in "response", use the ACTUAL values from context, NOT template syntax like {{{{variable}}}}
-3. Format lists as plain text like "• Channel1\\n• Channel2" NOT templates
-4. If you need data, first fetch it with a tool action, then in the next iteration use that data
-5. Use $context_name_data to reference extracted tool results
-6. For channel names in args, use just the name without # (e.g., "social" not "#social")
-7. For threads, the thread_ts is in the format like "1234567890.123456"
-"""
-            print(f"\n[Iteration {iteration}]")
-            plan_json = self.ask_gemini(prompt)
-            done = await self.execute_plan(plan_json)
+            done = await asyncio.gather(*(self.run_plan(plan) for plan in plans))
+            pending = [p for p, d in zip(pending, done) if not d]
 
     async def run_async(self):
         await self.connect_mcp()
         print("Gemini Slack Agent ready — type 'exit' to quit.")
+        # One long-lived reader thread for the prompt, kept out of the
+        # default executor so stdin reads never queue behind other work
+        loop = asyncio.get_running_loop()
+        input_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="stdin")
         while self.running:
             try:
-                user_input = await asyncio.to_thread(input, "> ")
+                user_input = await loop.run_in_executor(input_executor, input, "> ")
                 user_input = user_input.strip()
                 if not user_input:
                     continue
@@ -262,17 +802,53 @@ CRITICAL RULES:
                 break
             except Exception as e:
                 print(f"[Error] {e}")
-                import traceback
-                traceback.print_exc()
+                logger.exception("failed to handle user input")
 
+        input_executor.shutdown(wait=False)
+        self.clear_planner_cache()
         if self.mcp_client:
             await self.mcp_client.cleanup()
             print("✅ Disconnected from MCP server")
 
+    async def run_batch_async(self, queries: List[str]):
+        await self.connect_mcp()
+        try:
+            await self.handle_user_inputs(queries)
+        finally:
+            self.clear_planner_cache()
+            await self.mcp_client.cleanup()
+            print("✅ Disconnected from MCP server")
+
     def run(self):
         asyncio.run(self.run_async())
 
+    def run_batch(self, queries: List[str]):
+        asyncio.run(self.run_batch_async(queries))
+
+
+def setup_logging() -> QueueListener:
+    """
+    Route log records through a queue so formatting and stderr writes happen
+    on the listener thread instead of blocking the event loop
+    """
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    # QueueHandler formats records (including tracebacks) before enqueueing
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("[%(levelname)s] %(name)s: %(message)s"))
+    logging.basicConfig(level=logging.WARNING, handlers=[queue_handler])
+    listener = QueueListener(log_queue, logging.StreamHandler())
+    listener.start()
+    return listener
+
 
 if __name__ == "__main__":
-    agent = GeminiSlackAgent()
-    agent.run()
\ No newline at end of file
+    listener = setup_logging()
+    try:
+        agent = GeminiSlackAgent()
+        if len(sys.argv) > 1:
+            # Scripted usage: each argument is an independent query
+            agent.run_batch(sys.argv[1:])
+        else:
+            agent.run()
+    finally:
+        listener.stop()
\ No newline at end of file
@@ -1,9 +1,10 @@
 # mcp_client.py
 
 import sys
+import json
 import asyncio
 from contextlib import AsyncExitStack
-from typing import Any, Optional, List, Dict
+from typing import Any, Optional, List, Dict, Tuple
 from pydantic import AnyUrl
 from mcp import ClientSession, StdioServerParameters, types
 from mcp.client.stdio import stdio_client
@@ -22,6 +23,8 @@ class SlackMCPClientWithLLM:
         self._env = env
         self._session: Optional[ClientSession] = None
         self._exit_stack: AsyncExitStack = AsyncExitStack()
+        self._tool_summary: Optional[List[Dict[str, str]]] = None
+        self._tool_summary_json: Optional[str] = None
 
     async def connect(self):
         """Connect to MCP server using stdio transport"""
@@ -38,6 +41,7 @@ class SlackMCPClientWithLLM:
             ClientSession(_stdio, _write)
         )
         await self._session.initialize()
+        await self.refresh_tools()
         print("✅ Connected to MCP Server")
 
     def session(self) -> ClientSession:
@@ -58,6 +62,18 @@ class SlackMCPClientWithLLM:
         tool_input = tool_input or {}
         return await self.session().call_tool(tool_name, tool_input)
 
+    async def call_tools_batch(self, calls: List[Tuple[str, dict]]) -> List[Any]:
+        """
+        Call several MCP tools at once, returning results in call order.
+        A failed call yields its exception in place of a result.
+        """
+        # The MCP spec dropped JSON-RPC batching, so calls are multiplexed
+        # concurrently over the one session instead of sent as a batch array
+        return await asyncio.gather(
+            *(self.call_tool(name, args) for name, args in calls),
+            return_exceptions=True,
+        )
+
     async def list_prompts(self) -> List[types.Prompt]:
         result = await self.session().list_prompts()
         return result.prompts
@@ -72,7 +88,6 @@ class SlackMCPClientWithLLM:
 
         if isinstance(resource, types.TextResourceContents):
             if resource.mimeType == "application/json":
-                import json
                 return json.loads(resource.text)
             return resource.text
 
@@ -95,12 +110,29 @@ class SlackMCPClientWithLLM:
     # -------------------------
     # New: Tool list for LLM planning
     # -------------------------
+    async def refresh_tools(self):
+        """
+        Fetch the tool list from the server and cache its summary and JSON form.
+        """
+        tools = await self.list_tools()
+        self._tool_summary = [{"name": t.name, "description": t.description} for t in tools]
+        self._tool_summary_json = json.dumps(self._tool_summary, indent=2)
+
     async def get_tool_list_summary(self) -> List[Dict[str, str]]:
         """
         Return a simple summary of tools (name + description) for LLM planning.
         """
-        tools = await self.list_tools()
-        return [{"name": t.name, "description": t.description} for t in tools]
+        if self._tool_summary is None:
+            await self.refresh_tools()
+        return self._tool_summary
+
+    async def get_tool_list_summary_json(self) -> str:
+        """
+        Return the memoized JSON string of the tool summary for LLM prompts.
+        """
+        if self._tool_summary_json is None:
+            await self.refresh_tools()
+        return self._tool_summary_json
 
     # -------------------------
     # Cleanup
@@ -108,6 +140,8 @@ class SlackMCPClientWithLLM:
     async def cleanup(self):
         await self._exit_stack.aclose()
         self._session = None
+        self._tool_summary = None
+        self._tool_summary_json = None
 
     async def __aenter__(self):
         await self.connect()
@@ -1,108 +1,158 @@
 # mcp_server.py
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Annotated, Optional
 from mcp.server.fastmcp import FastMCP
 from pydantic import Field
 from slack_tools import (
     get_channel_messages,
+    get_channels_messages,
     list_channels,
     post_message,
     get_threads,
+    get_thread_by_ts,
     reply_to_thread as slack_reply_to_thread,
     search_messages,
     summarize_channel_source,
-    extract_action_items,
+    get_channel_action_items,
 )
 
 # Initialize MCP server
 mcp = FastMCP("SlackMCP", log_level="ERROR")
 
 
+# Slack calls block on HTTP, so they run on this bounded pool of worker
+# threads; FastMCP keeps serving other requests while one waits on Slack
+SLACK_WORKERS = 16
+slack_executor = ThreadPoolExecutor(
+    max_workers=SLACK_WORKERS, thread_name_prefix="slack"
+)
+
+
+async def run_blocking(func, *args, **kwargs):
+    """Run a blocking slack_tools call on the Slack worker pool"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(slack_executor, partial(func, *args, **kwargs))
+
+
+# Parameter types shared by several tools, built once at import
+ChannelName = Annotated[str, Field(description="Channel name WITHOUT the # symbol")]
+MessageLimit = Annotated[
+    int, Field(description="Number of messages to fetch (default 50)")
+]
+OldestTs = Annotated[
+    Optional[str],
+    Field(
+        description="Only include messages after this Slack timestamp "
+        "(e.g., '1768831010.322079'); omit for no lower bound"
+    ),
+]
+
+
 # MCP Tools
 @mcp.tool(
     name="get_channel_messages",
     description="Fetch the last messages from a Slack channel by name or ID",
 )
-def fetch_channel_messages(
-    channel: str = Field(description="Channel name WITHOUT the # symbol"),
-    limit: int = Field(
-        default=50, description="Number of messages to fetch (default 50)"
-    ),
+async def fetch_channel_messages(
+    channel: ChannelName,
+    limit: MessageLimit = 50,
+    oldest: OldestTs = None,
 ):
     """
     MCP tool that fetches messages from Slack channel.
     """
-    return get_channel_messages(channel, limit)
+    return await run_blocking(get_channel_messages, channel, limit, oldest=oldest)
 
 
 @mcp.tool(name="list_channels", description="List all channels the bot has access to")
-def fetch_channels():
+async def fetch_channels():
     """
     MCP tool that lists Slack channels available to the bot.
     """
-    return list_channels()
+    return await run_blocking(list_channels)
 
 
 @mcp.tool(
     name="post_message",
     description="Post a message to a Slack channel. Parameters: channel (string), message (string)",
 )
-def send_message(
-    channel: str = Field(description="Channel name WITHOUT the # symbol"),
-    message: str = Field(description="The text message to post to the channel"),
+async def send_message(
+    channel: ChannelName,
+    message: Annotated[
+        str, Field(description="The text message to post to the channel")
+    ],
 ):
     """
     MCP tool that posts a message to a Slack channel.
     """
-    return post_message(channel, message)
+    return await run_blocking(post_message, channel, message)
 
 
 @mcp.tool(
     name="get_threads",
     description="Fetch the threads from a Slack channel by name or ID",
 )
-def fetch_threads(
-    channel: str = Field(description="Channel name WITHOUT the # symbol"),
-    limit: int = Field(
-        default=20, description="Number of threads to fetch (default 20)"
-    ),
+async def fetch_threads(
+    channel: ChannelName,
+    limit: Annotated[
+        int, Field(description="Number of threads to fetch (default 20)")
+    ] = 20,
+    include_replies: Annotated[
+        bool,
+        Field(
+            description="Also fetch each thread's replies; set to false when "
+            "only the parent messages and reply counts are needed"
+        ),
+    ] = True,
+    oldest: OldestTs = None,
 ):
     """
     MCP tool that fetches threads from a Slack channel.
     """
-    return get_threads(channel, limit)
+    return await run_blocking(
+        get_threads, channel, limit, include_replies=include_replies, oldest=oldest
+    )
 
 
 @mcp.tool(
     name="reply_to_thread",
     description="Reply to a thread in a Slack channel. Parameters: channel (string), thread_ts (string), message (string)",
 )
-def reply_thread(
-    channel: str = Field(description="Channel name WITHOUT the # symbol"),
-    thread_ts: str = Field(
-        description="The thread timestamp to reply to (e.g., '1768831010.322079')"
-    ),
-    message: str = Field(
-        description="The text message to post as a reply in the thread"
-    ),
+async def reply_thread(
+    channel: ChannelName,
+    thread_ts: Annotated[
+        str,
+        Field(
+            description="The thread timestamp to reply to (e.g., '1768831010.322079')"
+        ),
+    ],
+    message: Annotated[
+        str, Field(description="The text message to post as a reply in the thread")
+    ],
 ):
     """
     MCP tool that replies to a thread in a Slack channel.
     """
-    return slack_reply_to_thread(channel, thread_ts, message)
+    return await run_blocking(slack_reply_to_thread, channel, thread_ts, message)
 
 
 @mcp.tool(
     name="search_messages",
     description="Search messages across Slack channels by text query",
 )
-def search_slack_messages(
-    query: str = Field(description="Search query text (e.g., 'deployment failure')"),
-    limit: int = Field(default=20, description="Maximum number of results"),
+async def search_slack_messages(
+    query: Annotated[
+        str, Field(description="Search query text (e.g., 'deployment failure')")
+    ],
+    limit: Annotated[int, Field(description="Maximum number of results")] = 20,
 ):
     """
     MCP tool that searches Slack messages.
     """
-    return search_messages(query, limit)
+    return await run_blocking(search_messages, query, limit)
 
 
 @mcp.tool(
@@ -112,37 +162,36 @@ def search_slack_messages(
         "The server prepares the data; the client performs completion."
     ),
 )
-def summarize_channel(
-    channel: str = Field(description="Slack channel name (without #) or channel ID"),
-    limit: int = Field(
-        default=50, description="Number of recent messages to include in the summary"
-    ),
+async def summarize_channel(
+    channel: Annotated[
+        str, Field(description="Slack channel name (without #) or channel ID")
+    ],
+    limit: Annotated[
+        int, Field(description="Number of recent messages to include in the summary")
+    ] = 50,
 ):
     """
     MCP sampling tool:
     - Server gathers messages
     - Client LLM generates summary
     """
-    return summarize_channel_source(channel, limit)
+    return await run_blocking(summarize_channel_source, channel, limit)
 
 
 @mcp.tool(
     name="extract_action_items",
     description="Extract actionable items from a Slack channel",
 )
-def extract_items_tool(
-    channel: str = Field(description="Channel name WITHOUT the # symbol"),
-    limit: int = Field(
-        default=50, description="Number of messages to fetch (default 50)"
-    ),
+async def extract_items_tool(
+    channel: ChannelName,
+    limit: MessageLimit = 50,
 ):
     """
     MCP tool to extract action items from the latest messages of a Slack channel.
     """
-    messages = get_channel_messages(channel, limit)
-    if not messages:
+    items = await run_blocking(get_channel_action_items, channel, limit)
+    if items is None:
         return {"status": "empty", "message": "No messages to analyze"}
-    items = extract_action_items(messages)
     return {"channel": channel, "action_items": items}
 
 
@@ -152,7 +201,7 @@ def extract_items_tool(
     description="Generate a daily summary of a Slack channel, focusing on important messages and decisions.",
 )
 async def daily_channel_summary(channel: str, limit: int = 50):
-    payload = summarize_channel_source(channel, limit)
+    payload = await run_blocking(summarize_channel_source, channel, limit)
     if payload["sampled_text"]:
         prompt_text = (
             payload["instructions"] + "\n\n" + "\n".join(payload["sampled_text"])
@@ -162,15 +211,38 @@ async def daily_channel_summary(channel: str, limit: int = 50):
         return "No messages to summarize."
 
 
+@mcp.prompt(
+    name="multi_channel_summary",
+    description="Generate a combined summary of several Slack channels (comma-separated names).",
+)
+async def multi_channel_summary(channels: str, limit: int = 50):
+    names = [c.strip().lstrip("#") for c in channels.split(",") if c.strip()]
+    if not names:
+        return "No channels given."
+    results = await run_blocking(get_channels_messages, names, limit)
+    sections = []
+    for name, messages in results.items():
+        if isinstance(messages, Exception):
+            sections.append(f"#{name}: (could not fetch messages: {messages})")
+        elif messages:
+            sections.append(f"#{name}:\n" + "\n".join(messages))
+    if not sections:
+        return "No messages to summarize."
+    return (
+        "Summarize the following Slack channels. For each channel list the key "
+        "topics, decisions and action items, then give a short overall digest.\n\n"
+        + "\n\n".join(sections)
+    )
+
+
 @mcp.prompt(
     name="action_items_summary",
     description="Extract actionable items from a Slack channel or thread.",
 )
 async def action_items_summary(channel: str, limit: int = 50):
-    messages = get_channel_messages(channel, limit)
-    if not messages:
+    items = await run_blocking(get_channel_action_items, channel, limit)
+    if items is None:
         return "No messages in channel."
-    items = extract_action_items(messages)
     if not items:
         return "No action items found."
     return items
@@ -181,15 +253,7 @@ async def action_items_summary(channel: str, limit: int = 50):
     description="Summarize a Slack thread and optionally generate a reply using client LLM.",
 )
 async def thread_followup(channel: str, thread_ts: str):
-    threads = get_threads(channel, limit=50)
-    thread = next(
-        (
-            t
-            for t in threads
-            if t.get("parent_ts") == thread_ts or t.get("thread_ts") == thread_ts
-        ),
-        None,
-    )
+    thread = await run_blocking(get_thread_by_ts, channel, thread_ts)
     if not thread:
         return "Thread not found."
     messages = [thread.get("parent_text", "")] + [
@@ -1,34 +1,272 @@
 # slack_tools.py
 
 import os
+import re
+import time
+import logging
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
+from slack_sdk.http_retry.builtin_handlers import ConnectionErrorRetryHandler
 from dotenv import load_dotenv
-from typing import List, Dict, Optional
-import random
+from typing import (
+    Deque,
+    Iterable,
+    Iterator,
+    List,
+    Dict,
+    Optional,
+    Tuple,
+    Union,
+)
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 # Default tokens (for single-user mode / backwards compatibility)
 default_slack_token = os.environ.get("SLACK_USER_TOKEN")
 default_slack_bot_token = os.environ.get("SLACK_BOT_TOKEN")
 
+# Dropped connections are retried inside the SDK with backoff; HTTP 429 is
+# left to _call, which already honours Retry-After for every call
+SLACK_CONNECTION_RETRIES = 2
+
+
+def _new_client(token: str) -> WebClient:
+    """Build a WebClient that retries dropped connections."""
+    return WebClient(
+        token=token,
+        retry_handlers=[
+            ConnectionErrorRetryHandler(max_retry_count=SLACK_CONNECTION_RETRIES)
+        ],
+    )
+
+
 # Global clients (for single-user mode)
 if default_slack_token:
-    client = WebClient(token=default_slack_token)
+    client = _new_client(default_slack_token)
 else:
     client = None
 
 if default_slack_bot_token:
-    bot_client = WebClient(token=default_slack_bot_token)
+    bot_client = _new_client(default_slack_bot_token)
 else:
     bot_client = None
 
 
+def _env_int(name: str, default: int, minimum: int = 1) -> int:
+    """
+    Read a positive integer setting from the environment, falling back to
+    the default (with a warning) when it is not a number or below minimum.
+    """
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        logger.warning("%s=%r is not an integer; using %d", name, raw, default)
+        return default
+    if value < minimum:
+        logger.warning("%s=%d is below %d; using %d", name, value, minimum, default)
+        return default
+    return value
+
+
+# Worker count of each Slack fan-out pool below; kept small so one call's
+# fan-out does not burst past Slack's rate limits
+SLACK_MAX_CONCURRENT_REQUESTS = _env_int("SLACK_MAX_CONCURRENT_REQUESTS", 5)
+
+# Pool for the per-thread conversations.replies calls in get_threads
+_replies_executor = ThreadPoolExecutor(
+    max_workers=SLACK_MAX_CONCURRENT_REQUESTS, thread_name_prefix="slack-replies"
+)
+
+# Pool for per-channel fan-out (get_channels_messages, post_messages_bulk)
+_fanout_executor = ThreadPoolExecutor(
+    max_workers=SLACK_MAX_CONCURRENT_REQUESTS, thread_name_prefix="slack-fanout"
+)
+
+# Slack calls retry on HTTP 429 after the Retry-After delay, up to this many times
+SLACK_MAX_RETRIES = 3
+
+
+class _AIMDLimiter:
+    """
+    Caps the number of Slack calls in flight. The cap grows additively while
+    calls succeed and halves whenever Slack answers with a 429, so bursts back
+    off instead of piling more rate-limited requests onto Slack.
+    """
+
+    def __init__(
+        self,
+        initial: float = 8,
+        minimum: float = 1,
+        maximum: float = 32,
+        increase: float = 0.5,
+        decrease: float = 0.5,
+    ):
+        self.limit = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self.increase = increase
+        self.decrease = decrease
+        self.in_flight = 0
+        self._cond = threading.Condition()
+
+    def acquire(self):
+        with self._cond:
+            while self.in_flight >= int(self.limit):
+                self._cond.wait()
+            self.in_flight += 1
+
+    def release(self, throttled: bool = False):
+        with self._cond:
+            self.in_flight -= 1
+            if throttled:
+                self.limit = max(self.minimum, self.limit * self.decrease)
+            else:
+                # Roughly +increase per full window of successful calls
+                self.limit = min(self.maximum, self.limit + self.increase / self.limit)
+            self._cond.notify_all()
+
+
+_limiter = _AIMDLimiter()
+
+# Calls allowed per minute for each Web API method, from Slack's rate limit
+# tiers (Tier 2 = 20/min, Tier 3 = 50/min); other methods use the default
+SLACK_METHOD_LIMITS = {
+    "conversations_list": 20,
+    "search_messages": 20,
+    "conversations_history": 50,
+    "conversations_replies": 50,
+    "conversations_join": 50,
+    "chat_postMessage": 50,
+}
+SLACK_DEFAULT_LIMIT = 50
+
+
+class _RateLimiter:
+    """
+    Sliding one-minute window per (token, method): a call waits until the
+    method is back under its per-minute budget, so bursts are paced before
+    Slack has to reject them with a 429.
+    """
+
+    def __init__(self, limits: Dict[str, int], default: int, window: float = 60.0):
+        self.limits = limits
+        self.default = default
+        self.window = window
+        self._calls: Dict[Tuple[Optional[str], str], Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def wait(self, token: Optional[str], method_name: str):
+        allowed = self.limits.get(method_name, self.default)
+        key = (token, method_name)
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                calls = self._calls.setdefault(key, deque())
+                while calls and now - calls[0] >= self.window:
+                    calls.popleft()
+                if len(calls) < allowed:
+                    calls.append(now)
+                    return
+                delay = self.window - (now - calls[0])
+            time.sleep(delay)
+
+
+_rate_limiter = _RateLimiter(SLACK_METHOD_LIMITS, SLACK_DEFAULT_LIMIT)
+
+
+def _retry_after(e: SlackApiError) -> float:
+    """Seconds Slack asked us to wait before retrying (defaults to 1)."""
+    for name, value in (e.response.headers or {}).items():
+        if name.lower() == "retry-after":
+            if isinstance(value, list):
+                value = value[0]
+            try:
+                return float(value)
+            except (TypeError, ValueError):
+                break
+    return 1.0
+
+
+def _call(method, **kwargs):
+    """
+    Call a WebClient method once its per-method budget allows, under the
+    shared concurrency limit, sleeping for Retry-After and trying again when
+    Slack rate-limits the request anyway.
+    """
+    token = getattr(getattr(method, "__self__", None), "token", None)
+    method_name = getattr(method, "__name__", "")
+    for attempt in range(SLACK_MAX_RETRIES + 1):
+        _rate_limiter.wait(token, method_name)
+        _limiter.acquire()
+        throttled = False
+        try:
+            return method(**kwargs)
+        except SlackApiError as e:
+            if e.response.status_code != 429 or attempt == SLACK_MAX_RETRIES:
+                raise
+            throttled = True
+            delay = _retry_after(e)
+        finally:
+            _limiter.release(throttled)
+        time.sleep(delay)
+
+
+def _paginate(method, key: str, **kwargs) -> Iterator[Dict]:
+    """
+    Yield the items under `key` from every page of a cursor-paginated Web API
+    method, fetching each page through the rate-limited _call wrapper.
+    """
+    cursor = None
+    while True:
+        response = _call(method, cursor=cursor, **kwargs)
+        yield from response.get(key, [])
+        cursor = (response.get("response_metadata") or {}).get("next_cursor")
+        if not cursor:
+            return
+
+
+# Clients built for explicitly passed tokens, reused across calls so each
+# token keeps one connection pool; the lock stops concurrent first calls
+# from building (and discarding) extra clients
+_token_clients: Dict[str, WebClient] = {}
+_token_clients_lock = threading.Lock()
+
+DEFAULT_CHANNEL_TYPES = "public_channel,private_channel"
+
+# conversations_list results per (token, types) as (channels, name -> ID map,
+# fetched_at), reused for CHANNEL_CACHE_TTL seconds; a lock per key makes
+# concurrent misses share a single Slack call
+CHANNEL_CACHE_TTL = 600
+CHANNEL_PAGE_SIZE = 999  # conversations.list allows up to 1000 per page
+HISTORY_PAGE_SIZE = 999  # conversations.history allows up to 1000 per page
+REPLIES_PAGE_SIZE = 999  # conversations.replies allows up to 1000 per page
+_channel_cache: Dict[
+    Tuple[Optional[str], str], Tuple[List[Dict], Dict[str, str], float]
+] = {}
+_channel_cache_locks: Dict[Tuple[Optional[str], str], threading.Lock] = {}
+
+# search_messages results per (token, query, limit), reused for
+# SEARCH_CACHE_TTL seconds; the oldest entries are evicted past the size cap
+SEARCH_CACHE_TTL = 30
+SEARCH_CACHE_SIZE = 256
+SEARCH_PAGE_SIZE = 100  # search.messages returns at most 100 matches per page
+_search_cache: "OrderedDict[Tuple, Tuple[List[Dict], float]]" = OrderedDict()
+_search_cache_lock = threading.Lock()
+
+
 def get_client(user_token: Optional[str] = None) -> WebClient:
     """Get Slack client - use user token if provided, otherwise use default."""
     if user_token:
-        return WebClient(token=user_token)
+        return _client_for_token(user_token)
     if client:
         return client
     raise ValueError(
@@ -39,14 +277,96 @@ def get_client(user_token: Optional[str] = None) -> WebClient:
 def get_bot_client(bot_token: Optional[str] = None) -> Optional[WebClient]:
     """Get Slack bot client - use provided token or default."""
     if bot_token:
-        return WebClient(token=bot_token)
+        return _client_for_token(bot_token)
     if bot_client:
         return bot_client
     return None
 
 
+def _client_for_token(token: str) -> WebClient:
+    """Return the shared WebClient for a token, creating it on first use."""
+    c = _token_clients.get(token)
+    if c is None:
+        with _token_clients_lock:
+            c = _token_clients.get(token)
+            if c is None:
+                c = _token_clients[token] = _new_client(token)
+    return c
+
+
+def _load_channels(
+    types: str, user_token: Optional[str], max_age: float = CHANNEL_CACHE_TTL
+) -> Tuple[List[Dict], Dict[str, str], float]:
+    """Return the cached channel list for a token, fetching it if older than max_age."""
+    key = (user_token, types)
+    entry = _channel_cache.get(key)
+    if entry and time.monotonic() - entry[2] < max_age:
+        return entry
+
+    with _channel_cache_locks.setdefault(key, threading.Lock()):
+        # Another thread may have refreshed it while we waited
+        entry = _channel_cache.get(key)
+        if entry and time.monotonic() - entry[2] < max_age:
+            return entry
+
+        c = get_client(user_token)
+        channels = []
+        complete = True
+        try:
+            for ch in _paginate(
+                c.conversations_list, "channels", types=types, limit=CHANNEL_PAGE_SIZE
+            ):
+                channels.append({"id": ch["id"], "name": ch["name"]})
+        except SlackApiError as e:
+            if e.response["error"] != "ratelimited" or not channels:
+                raise
+            # Keep what we have rather than failing the whole listing
+            logger.warning(
+                "Rate limited listing channels; returning %d partial results",
+                len(channels),
+            )
+            complete = False
+
+        entry = (channels, {ch["name"]: ch["id"] for ch in channels}, time.monotonic())
+        if complete:  # a partial list is not cached
+            _channel_cache[key] = entry
+        return entry
+
+
+def iter_channels(
+    types: str = DEFAULT_CHANNEL_TYPES, user_token: Optional[str] = None
+) -> Iterator[Dict]:
+    """
+    Yields the channels the bot has access to one at a time, as copies of
+    the cached entries, so a caller looking for a few channels can stop
+    without copying the rest.
+
+    Parameters:
+    - types (str): Channel types to include (default: public & private)
+    - user_token (Optional[str]): User's Slack token for multi-user mode
+    """
+    channels, _, _ = _load_channels(types, user_token)
+    for ch in channels:
+        yield dict(ch)
+
+
+def invalidate_channel_cache(user_token: Optional[str] = None):
+    """
+    Drops the cached channel lists for a token so the next lookup fetches
+    them again from Slack.
+
+    Parameters:
+    - user_token (Optional[str]): Token whose cache to drop (default token
+      when omitted)
+    """
+    # Snapshot the keys: other threads may insert entries while we iterate
+    for key in list(_channel_cache):
+        if key[0] == user_token:
+            _channel_cache.pop(key, None)
+
+
 def list_channels(
-    types: str = "public_channel,private_channel", user_token: Optional[str] = None
+    types: str = DEFAULT_CHANNEL_TYPES, user_token: Optional[str] = None
 ) -> List[Dict]:
     """
     Returns a list of channels the bot has access to.
@@ -59,10 +379,7 @@ def list_channels(
     - List of dictionaries with 'id' and 'name' of channels
     """
     try:
-        c = get_client(user_token)
-        response = c.conversations_list(types=types)
-        channels = response.get("channels", [])
-        return [{"id": c["id"], "name": c["name"]} for c in channels]
+        return list(iter_channels(types, user_token))
 
     except SlackApiError as e:
         raise ValueError(f"Slack API Error: {e.response['error']}")
@@ -70,26 +387,74 @@ def list_channels(
         raise ValueError(f"Failed to list channels: {str(e)}")
 
 
+# Shape of a Slack channel / group / DM ID, e.g. C024BE91L
+_SLACK_ID_RE = re.compile(r"^[CGD][A-Z0-9]{8,}$")
+
+
+def _channel_name(channel: str) -> str:
+    """Strip the single leading # a channel name may be given with."""
+    return channel[1:] if channel.startswith("#") else channel
+
+
 def get_channel_id(channel: str, user_token: Optional[str] = None) -> str:
     """
     Converts a channel name (e.g., #general) or ID to the channel ID.
     """
-    if channel.startswith("#"):
-        channel_name = channel[1:]
-    else:
-        channel_name = channel
+    channel_name = _channel_name(channel)
+
+    # If already an ID (C, G or D followed by uppercase alphanumerics), return it
+    if _SLACK_ID_RE.match(channel_name):
+        return channel_name
+
+    # Map name to ID from the cached channel list; on a miss, refresh it
+    # unless it was already fetched during this call
+    started = time.monotonic()
+    _, ids, _ = _load_channels(DEFAULT_CHANNEL_TYPES, user_token)
+    if channel_name not in ids:
+        _, ids, _ = _load_channels(
+            DEFAULT_CHANNEL_TYPES, user_token, max_age=time.monotonic() - started
+        )
+    if channel_name in ids:
+        return ids[channel_name]
 
-    # If already an ID (starts with C, G, or D), return it
-    if channel.startswith(("C", "G", "D")):
-        return channel
+    raise ValueError(f"Channel '{channel}' not found or bot is not a member.")
 
-    # Map name to ID
-    channels = list_channels(user_token=user_token)
-    for c in channels:
-        if c["name"] == channel_name:
-            return c["id"]
 
-    raise ValueError(f"Channel '{channel}' not found or bot is not a member.")
+def resolve_channel_ids(
+    channels: List[str], user_token: Optional[str] = None
+) -> Dict[str, Optional[str]]:
+    """
+    Converts several channel names or IDs to channel IDs with one lookup
+    in the cached channel list, refreshed at most once for all misses.
+
+    Parameters:
+    - channels (List[str]): Slack channel IDs or names (with or without #)
+    - user_token (Optional[str]): User's Slack token for multi-user mode
+
+    Returns:
+    - Dictionary mapping each channel as given to its ID, or None if it
+      was not found
+    """
+    resolved: Dict[str, Optional[str]] = {}
+    names: Dict[str, str] = {}  # channel as given -> name still to look up
+    for channel in channels:
+        name = _channel_name(channel)
+        if _SLACK_ID_RE.match(name):
+            resolved[channel] = name
+        else:
+            names[channel] = name
+
+    # The channel list is only loaded when some input is a name
+    if names:
+        started = time.monotonic()
+        _, ids, _ = _load_channels(DEFAULT_CHANNEL_TYPES, user_token)
+        if any(name not in ids for name in names.values()):
+            _, ids, _ = _load_channels(
+                DEFAULT_CHANNEL_TYPES, user_token, max_age=time.monotonic() - started
+            )
+        for channel, name in names.items():
+            resolved[channel] = ids.get(name)
+    return resolved
 
 
 def join_channel_if_needed(channel_id: str, user_token: Optional[str] = None):
@@ -98,7 +463,7 @@ def join_channel_if_needed(channel_id: str, user_token: Optional[str] = None):
     """
     try:
         c = get_client(user_token)
-        c.conversations_join(channel=channel_id)
+        _call(c.conversations_join, channel=channel_id)
     except SlackApiError as e:
         if e.response["error"] == "method_not_supported_for_channel_type":
             # Private channel - bot must be invited
@@ -109,30 +474,82 @@ def join_channel_if_needed(channel_id: str, user_token: Optional[str] = None):
             raise
 
 
-def get_channel_messages(
-    channel: str, limit: int = 50, user_token: Optional[str] = None
-) -> List[str]:
+def _prepare(channel: str, user_token: Optional[str]) -> Tuple[WebClient, str]:
     """
-    Fetches messages from a given Slack channel by name or ID.
+    Resolve the client and channel ID for a channel-scoped call. Joining
+    is left to _call_in_channel, which only joins on not_in_channel.
+    """
+    return get_client(user_token), get_channel_id(channel, user_token)
+
+
+def _call_in_channel(method, channel_id: str, user_token: Optional[str], **kwargs):
+    """
+    Call a channel-scoped Web API method directly; only if Slack answers
+    not_in_channel, join the channel and try once more.
+    """
+    try:
+        return _call(method, channel=channel_id, **kwargs)
+    except SlackApiError as e:
+        if e.response["error"] == "channel_not_found":
+            # The cached ID may belong to a deleted or archived channel
+            invalidate_channel_cache(user_token)
+        if e.response["error"] != "not_in_channel":
+            raise
+    join_channel_if_needed(channel_id, user_token)
+    return _call(method, channel=channel_id, **kwargs)
+
+
+def iter_channel_messages(
+    channel: str,
+    user_token: Optional[str] = None,
+    page_size: int = 200,
+    oldest: Optional[str] = None,
+) -> Iterator[Dict]:
+    """
+    Yields raw Slack message dicts from a channel, newest first. History
+    pages are fetched only as the caller consumes them, so a caller that
+    stops early (e.g. through itertools.islice) never requests later pages.
 
     Parameters:
     - channel (str): Slack channel ID or name (with or without #)
-    - limit (int): Number of messages to fetch (default 50)
     - user_token (Optional[str]): User's Slack token for multi-user mode
+    - page_size (int): Messages requested per conversations.history call
+    - oldest (Optional[str]): Only messages after this Slack timestamp
+    """
+    c, channel_id = _prepare(channel, user_token)
+    cursor = None
+    while True:
+        response = _call_in_channel(
+            c.conversations_history,
+            channel_id,
+            user_token,
+            limit=page_size,
+            cursor=cursor,
+            oldest=oldest,
+            include_all_metadata=False,
+        )
+        yield from response.get("messages", [])
+        cursor = (response.get("response_metadata") or {}).get("next_cursor")
+        if not cursor:
+            return
 
-    Returns:
-    - List of message strings in chronological order
+
+def _fetch_channel_messages(
+    channel: str,
+    limit: int = 50,
+    user_token: Optional[str] = None,
+    oldest: Optional[str] = None,
+) -> List[Dict]:
+    """
+    Fetches raw Slack message dicts from a channel, in chronological order.
     """
     try:
-        channel_id = get_channel_id(channel, user_token)
-        # Attempt to join public channels if not already in
-        join_channel_if_needed(channel_id, user_token)
-
-        c = get_client(user_token)
-        response = c.conversations_history(channel=channel_id, limit=limit)
-        messages = response.get("messages", [])
+        page_size = min(limit, HISTORY_PAGE_SIZE)
+        messages = list(
+            islice(iter_channel_messages(channel, user_token, page_size, oldest), limit)
+        )
         messages.reverse()  # chronological order
-        return [msg.get("text", "") for msg in messages]
+        return messages
 
     except SlackApiError as e:
         if e.response["error"] == "not_in_channel":
@@ -144,6 +561,59 @@ def get_channel_messages(
         raise ValueError(f"Failed to fetch messages: {str(e)}")
 
 
+def get_channel_messages(
+    channel: str,
+    limit: int = 50,
+    user_token: Optional[str] = None,
+    oldest: Optional[str] = None,
+) -> List[str]:
+    """
+    Fetches messages from a given Slack channel by name or ID.
+
+    Parameters:
+    - channel (str): Slack channel ID or name (with or without #)
+    - limit (int): Number of messages to fetch (default 50)
+    - user_token (Optional[str]): User's Slack token for multi-user mode
+    - oldest (Optional[str]): Only messages after this Slack timestamp
+
+    Returns:
+    - List of message strings in chronological order
+    """
+    messages = _fetch_channel_messages(channel, limit, user_token, oldest)
+    return [msg.get("text", "") for msg in messages]
+
+
+def get_channels_messages(
+    channels: List[str], limit: int = 50, user_token: Optional[str] = None
+) -> Dict[str, Union[List[str], ValueError]]:
+    """
+    Fetches messages from several Slack channels concurrently.
+
+    Parameters:
+    - channels (List[str]): Slack channel IDs or names (with or without #)
+    - limit (int): Number of messages to fetch per channel (default 50)
+    - user_token (Optional[str]): User's Slack token for multi-user mode
+
+    Returns:
+    - Dictionary mapping each channel as given to its message strings in
+      chronological order, or to the ValueError raised if that channel
+      could not be fetched
+    """
+    futures = {
+        channel: _fanout_executor.submit(
+            get_channel_messages, channel, limit, user_token
+        )
+        for channel in dict.fromkeys(channels)
+    }
+    results: Dict[str, Union[List[str], ValueError]] = {}
+    for channel, future in futures.items():
+        try:
+            results[channel] = future.result()
+        except ValueError as e:
+            results[channel] = e
+    return results
+
+
 def post_message(channel: str, message: str, user_token: Optional[str] = None) -> Dict:
     """
     Posts a message to a Slack channel.
@@ -157,11 +627,10 @@ def post_message(channel: str, message: str, user_token: Optional[str] = None) -
     - Dictionary with channel and timestamp of posted message
     """
     try:
-        channel_id = get_channel_id(channel, user_token)
-        join_channel_if_needed(channel_id, user_token)
-
-        c = get_client(user_token)
-        response = c.chat_postMessage(channel=channel_id, text=message)
+        c, channel_id = _prepare(channel, user_token)
+        response = _call_in_channel(
+            c.chat_postMessage, channel_id, user_token, text=message
+        )
 
         return {
             "channel": channel,
@@ -176,8 +645,56 @@ def post_message(channel: str, message: str, user_token: Optional[str] = None) -
         raise ValueError(f"Failed to post message: {str(e)}")
 
 
+def _fetch_replies(
+    c: WebClient, channel_id: str, thread_ts: str, user_token: Optional[str]
+) -> List[Dict]:
+    """
+    Fetches every message of a thread (parent first), following
+    conversations.replies cursors so long threads are not truncated.
+    """
+    messages: List[Dict] = []
+    cursor = None
+    while True:
+        response = _call_in_channel(
+            c.conversations_replies,
+            channel_id,
+            user_token,
+            ts=thread_ts,
+            limit=REPLIES_PAGE_SIZE,
+            cursor=cursor,
+        )
+        messages.extend(response.get("messages", []))
+        cursor = (response.get("response_metadata") or {}).get("next_cursor")
+        if not cursor:
+            return messages
+
+
+def _build_thread(parent: Dict, messages: List[Dict]) -> Dict:
+    """
+    Shape a thread's parent message and its conversations.replies messages
+    (parent first, as Slack returns them) into a thread dict.
+    """
+    return {
+        "thread_ts": parent["ts"],
+        "parent_text": parent.get("text", ""),
+        "reply_count": parent.get("reply_count", 0),
+        "replies": [
+            {
+                "user": r.get("user"),
+                "text": r.get("text"),
+                "ts": r.get("ts"),
+            }
+            for r in messages[1:]  # skip parent message
+        ],
+    }
+
+
 def get_threads(
-    channel: str, limit: int = 20, user_token: Optional[str] = None
+    channel: str,
+    limit: int = 20,
+    user_token: Optional[str] = None,
+    include_replies: bool = True,
+    oldest: Optional[str] = None,
 ) -> List[Dict]:
     """
     Fetches threads from a Slack channel.
@@ -186,42 +703,52 @@ def get_threads(
     - channel (str): Slack channel ID or name (with or without #)
     - limit (int): Number of parent messages to inspect (default 20)
     - user_token (Optional[str]): User's Slack token for multi-user mode
+    - include_replies (bool): Fetch each thread's replies; when False only
+      the parent and reply_count from the channel history are returned,
+      with no conversations.replies calls
+    - oldest (Optional[str]): Only threads started after this Slack timestamp
 
     Returns:
     - List of threads with parent message and replies
     """
     try:
-        channel_id = get_channel_id(channel, user_token)
-        join_channel_if_needed(channel_id, user_token)
-        c = get_client(user_token)
+        c, channel_id = _prepare(channel, user_token)
 
         # Step 1: Get channel messages
-        history = c.conversations_history(channel=channel_id, limit=limit)
-
-        threads = []
-
-        for msg in history.get("messages", []):
-            # Only messages that start threads
-            if msg.get("reply_count", 0) > 0 and "ts" in msg:
-                replies_resp = c.conversations_replies(channel=channel_id, ts=msg["ts"])
-
-                replies = replies_resp.get("messages", [])
-
-                threads.append(
-                    {
-                        "thread_ts": msg["ts"],
-                        "parent_text": msg.get("text", ""),
-                        "reply_count": msg.get("reply_count", 0),
-                        "replies": [
-                            {
-                                "user": r.get("user"),
-                                "text": r.get("text"),
-                                "ts": r.get("ts"),
-                            }
-                            for r in replies[1:]  # skip parent message
-                        ],
-                    }
+        history = _call_in_channel(
+            c.conversations_history,
+            channel_id,
+            user_token,
+            limit=limit,
+            oldest=oldest,
+            include_all_metadata=False,
+        )
+
+        # Only messages that start threads
+        parents = [
+            msg
+            for msg in history.get("messages", [])
+            if msg.get("reply_count", 0) > 0 and "ts" in msg
+        ]
+
+        if not include_replies:
+            return [_build_thread(msg, [msg]) for msg in parents]
+
+        # Step 2: Fetch the replies of every thread concurrently
+        def fetch_replies(msg: Dict) -> List[Dict]:
+            try:
+                return _fetch_replies(c, channel_id, msg["ts"], user_token)
+            except SlackApiError as e:
+                # Keep the other threads; this one is returned without replies
+                logger.warning(
+                    "Failed to fetch replies for thread %s: %s",
+                    msg["ts"],
+                    e.response["error"],
                 )
+                return [msg]
+
+        replies = _replies_executor.map(fetch_replies, parents)
+        threads = [_build_thread(msg, r) for msg, r in zip(parents, replies)]
 
         return threads
 
@@ -231,6 +758,37 @@ def get_threads(
         raise ValueError(f"Failed to fetch threads: {str(e)}")
 
 
+def get_thread_by_ts(
+    channel: str, thread_ts: str, user_token: Optional[str] = None
+) -> Optional[Dict]:
+    """
+    Fetches a single thread from a Slack channel by its timestamp.
+
+    Parameters:
+    - channel (str): Slack channel ID or name (with or without #)
+    - thread_ts (str): Timestamp of the thread's parent message
+    - user_token (Optional[str]): User's Slack token for multi-user mode
+
+    Returns:
+    - Thread with parent message and replies, or None if it does not exist
+    """
+    try:
+        c, channel_id = _prepare(channel, user_token)
+
+        messages = _fetch_replies(c, channel_id, thread_ts, user_token)
+        if not messages:
+            return None
+
+        return _build_thread(messages[0], messages)
+
+    except SlackApiError as e:
+        if e.response["error"] == "thread_not_found":
+            return None
+        raise ValueError(f"Slack API Error: {e.response['error']}")
+    except Exception as e:
+        raise ValueError(f"Failed to fetch thread: {str(e)}")
+
+
 def reply_to_thread(
     channel: str, thread_ts: str, message: str, user_token: Optional[str] = None
 ) -> Dict:
@@ -247,12 +805,13 @@ def reply_to_thread(
     - Dictionary with channel, thread_ts, and timestamp of posted message
     """
     try:
-        channel_id = get_channel_id(channel, user_token)
-        join_channel_if_needed(channel_id, user_token)
-
-        c = get_client(user_token)
-        response = c.chat_postMessage(
-            channel=channel_id, text=message, thread_ts=thread_ts
+        c, channel_id = _prepare(channel, user_token)
+        response = _call_in_channel(
+            c.chat_postMessage,
+            channel_id,
+            user_token,
+            text=message,
+            thread_ts=thread_ts,
         )
 
         return {
@@ -269,6 +828,118 @@ def reply_to_thread(
         raise ValueError(f"Failed to reply to thread: {str(e)}")
 
 
+# Slack accepts about one message per second per channel, so
+# post_messages_bulk spaces out consecutive posts to the same channel
+SLACK_POST_INTERVAL = 1.0
+
+
+def post_messages_bulk(
+    items: List[Dict], user_token: Optional[str] = None
+) -> List[Optional[Union[Dict, ValueError]]]:
+    """
+    Posts several messages, each either to a channel or as a thread reply.
+    Different channels are posted to concurrently; messages for the same
+    channel are sent one after another in the order given, at most one per
+    SLACK_POST_INTERVAL seconds. Raises ValueError, before posting anything,
+    if an item lacks 'channel' or 'message'.
+
+    Parameters:
+    - items (List[Dict]): Messages as dicts with 'channel', 'message' and
+      optionally 'thread_ts'
+    - user_token (Optional[str]): User's Slack token for multi-user mode
+
+    Returns:
+    - One result per item, in input order: the post_message /
+      reply_to_thread result, or the ValueError raised for that item
+    """
+    # Reject malformed input before anything is posted
+    for i, item in enumerate(items):
+        if (
+            not isinstance(item, dict)
+            or not item.get("channel")
+            or "message" not in item
+        ):
+            raise ValueError(
+                f"Item {i} must be a dict with 'channel' and 'message' keys: {item!r}"
+            )
+
+    # Group by channel ID so "general" and "#general" share one queue;
+    # unresolvable names keep their own group and fail in post_message
+    try:
+        ids = resolve_channel_ids([item["channel"] for item in items], user_token)
+    except (SlackApiError, ValueError) as e:
+        logger.warning("Could not resolve channels before posting: %s", e)
+        ids = {}
+    by_channel: Dict[str, List[int]] = {}
+    for i, item in enumerate(items):
+        key = ids.get(item["channel"]) or item["channel"]
+        by_channel.setdefault(key, []).append(i)
+
+    results: List[Optional[Union[Dict, ValueError]]] = [None] * len(items)
+
+    def post_channel(indexes: List[int]):
+        last_post = None
+        for i in indexes:
+            item = items[i]
+            if last_post is not None:
+                time.sleep(max(0.0, last_post + SLACK_POST_INTERVAL - time.monotonic()))
+            last_post = time.monotonic()
+            try:
+                if item.get("thread_ts"):
+                    results[i] = reply_to_thread(
+                        item["channel"], item["thread_ts"], item["message"], user_token
+                    )
+                else:
+                    results[i] = post_message(
+                        item["channel"], item["message"], user_token
+                    )
+            except ValueError as e:
+                results[i] = e
+
+    list(_fanout_executor.map(post_channel, by_channel.values()))
+    return results
+
+
+def _project_match(msg: Dict) -> Dict:
+    """Pick the fields search_messages returns from one search match."""
+    channel = msg.get("channel") or {}
+    return {
+        "channel": channel.get("name"),
+        "channel_id": channel.get("id"),
+        "user": msg.get("username") or msg.get("user"),
+        "text": msg.get("text"),
+        "ts": msg.get("ts"),
+        "permalink": msg.get("permalink"),
+    }
+
+
+def iter_search_matches(
+    query: str, bot_token: Optional[str] = None, page_size: int = 20
+) -> Iterator[Dict]:
+    """
+    Yields search results one at a time, in Slack's ranking order. Result
+    pages are requested only as the caller consumes them.
+
+    Parameters:
+    - query (str): Text to search for
+    - bot_token (Optional[str]): Bot token for search
+    - page_size (int): Matches requested per search.messages call (max 100)
+    """
+    bc = get_bot_client(bot_token)
+    if not bc:
+        raise ValueError("Bot token not available for search")
+
+    page = 1
+    while True:
+        response = _call(bc.search_messages, query=query, count=page_size, page=page)
+        found = response.get("messages") or {}
+        for msg in found.get("matches", []):
+            yield _project_match(msg)
+        if page >= (found.get("paging") or {}).get("pages", 1):
+            return
+        page += 1
+
+
 def search_messages(
     query: str, limit: int = 20, bot_token: Optional[str] = None
 ) -> List[Dict]:
@@ -283,28 +954,22 @@ def search_messages(
     Returns:
     - List of matching messages with channel, user, text, and timestamp
     """
+    key = (bot_token, query, limit)
+    with _search_cache_lock:
+        cached = _search_cache.get(key)
+        if cached and time.monotonic() - cached[1] < SEARCH_CACHE_TTL:
+            return [dict(r) for r in cached[0]]
+
     try:
-        bc = get_bot_client(bot_token)
-        if not bc:
-            raise ValueError("Bot token not available for search")
-        response = bc.search_messages(query=query, count=limit)
-
-        matches = response.get("messages", {}).get("matches", [])
-
-        results = []
-        for msg in matches:
-            results.append(
-                {
-                    "channel": msg.get("channel", {}).get("name"),
-                    "channel_id": msg.get("channel", {}).get("id"),
-                    "user": msg.get("username") or msg.get("user"),
-                    "text": msg.get("text"),
-                    "ts": msg.get("ts"),
-                    "permalink": msg.get("permalink"),
-                }
-            )
+        page_size = min(limit, SEARCH_PAGE_SIZE)
+        results = list(islice(iter_search_matches(query, bot_token, page_size), limit))
 
-        return results
+        with _search_cache_lock:
+            _search_cache[key] = (results, time.monotonic())
+            _search_cache.move_to_end(key)
+            while len(_search_cache) > SEARCH_CACHE_SIZE:
+                _search_cache.popitem(last=False)
+        return [dict(r) for r in results]
 
     except SlackApiError as e:
         raise ValueError(f"Slack API Error: {e.response['error']}")
@@ -312,6 +977,34 @@ def search_messages(
         raise ValueError(f"Failed to search messages: {str(e)}")
 
 
+def _normalize_message(msg) -> Optional[str]:
+    """
+    Turn a message (plain string or Slack-style dict) into one line of
+    summary input, or None if it has no text.
+    """
+    # Case 1: message is already a string
+    if isinstance(msg, str):
+        return msg.strip() or None
+
+    # Case 2: message is a dict (Slack-style)
+    if isinstance(msg, dict):
+        text = (msg.get("text") or "").strip()
+        return f"{msg.get('user', 'unknown')}: {text}" if text else None
+
+    return None
+
+
+# Instructions returned with every non-empty summarize_channel_source result
+SUMMARY_INSTRUCTIONS = (
+    "Summarize the following Slack channel conversation.\n"
+    "Focus on:\n"
+    "- Key topics discussed\n"
+    "- Important updates or decisions\n"
+    "- Actionable takeaways (if any)\n\n"
+    "Keep the summary concise and structured."
+)
+
+
 def summarize_channel_source(
     channel: str, limit: int = 50, user_token: Optional[str] = None
 ):
@@ -319,78 +1012,95 @@ def summarize_channel_source(
     Prepare Slack channel messages for LLM-based summarization.
     No LLM call happens here.
     """
-    messages = get_channel_messages(channel, limit, user_token)
+    messages = _fetch_channel_messages(channel, limit, user_token)
 
     if not messages:
         return {"instructions": "No messages found in the channel.", "sampled_text": []}
 
-    sampled_text = []
-
-    for msg in messages:
-        # Case 1: message is already a string
-        if isinstance(msg, str):
-            text = msg.strip()
-            if text:
-                sampled_text.append(text)
-
-        # Case 2: message is a dict (Slack-style)
-        elif isinstance(msg, dict):
-            user = msg.get("user", "unknown")
-            text = msg.get("text", "").strip()
-            if text:
-                sampled_text.append(f"{user}: {text}")
+    sampled_text = [text for text in map(_normalize_message, messages) if text]
 
     return {
-        "instructions": (
-            "Summarize the following Slack channel conversation.\n"
-            "Focus on:\n"
-            "- Key topics discussed\n"
-            "- Important updates or decisions\n"
-            "- Actionable takeaways (if any)\n\n"
-            "Keep the summary concise and structured."
-        ),
+        "instructions": SUMMARY_INSTRUCTIONS,
         "sampled_text": sampled_text,
     }
 
 
-# slack_tools.py (add this)
+# Verbs/phrases that mark a message as an action item
+ACTION_VERBS = [
+    "assign",
+    "complete",
+    "review",
+    "update",
+    "follow up",
+    "schedule",
+    "submit",
+    "plan",
+    "fix",
+    "check",
+    "resolve",
+]
 
-import re
-from typing import List, Dict
+
+def _verb_pattern(verb: str) -> str:
+    """
+    Regex for an action verb or phrase that also accepts the -s, -ed and
+    -ing forms of its first word ("updates", "reviewed", "planning",
+    "followed up"), with whitespace or hyphens between phrase words.
+    """
+    head, *rest = verb.split()
+    if head.endswith("e"):
+        head_re = re.escape(head[:-1]) + "(?:e|es|ed|ing)"
+    else:
+        # The doubled consonant covers "planned", "submitting"
+        head_re = re.escape(head) + f"(?:s|es|ed|ing|{head[-1]}ed|{head[-1]}ing)?"
+    return r"[\s-]+".join([head_re, *map(re.escape, rest)])
+
+
+# One alternation scanned by the regex engine instead of a Python-level
+# substring test per verb; word boundaries keep "plan" from matching
+# "planetary" while inflected forms still count
+_ACTION_VERB_RE = re.compile(
+    r"\b(?:" + "|".join(map(_verb_pattern, ACTION_VERBS)) + r")\b",
+    re.IGNORECASE,
+)
+_MENTION_RE = re.compile(r"<@[\w]+>")
 
 
-def extract_action_items(messages: List[str]) -> List[str]:
+def extract_action_items(messages: Iterable[str]) -> List[str]:
     """
     Extract actionable items from a list of Slack messages.
     Looks for messages containing common action verbs or patterns.
 
     Parameters:
-    - messages: list of message strings
+    - messages: iterable of message strings
 
     Returns:
     - List of action item strings
     """
-    action_verbs = [
-        "assign",
-        "complete",
-        "review",
-        "update",
-        "follow up",
-        "schedule",
-        "submit",
-        "plan",
-        "fix",
-        "check",
-        "resolve",
+    # Remove user mentions from every message that names an action
+    return [
+        _MENTION_RE.sub("", msg).strip()
+        for msg in messages
+        if _ACTION_VERB_RE.search(msg)
     ]
 
-    action_items = []
 
-    for msg in messages:
-        msg_lower = msg.lower()
-        if any(verb in msg_lower for verb in action_verbs):
-            # Optional: remove user mentions and special characters
-            clean_msg = re.sub(r"<@[\w]+>", "", msg).strip()
-            action_items.append(clean_msg)
+def get_channel_action_items(
+    channel: str, limit: int = 50, user_token: Optional[str] = None
+) -> Optional[List[str]]:
+    """
+    Fetches the latest messages of a channel and extracts action items
+    in the same pass over the Slack response.
 
-    return action_items
+    Parameters:
+    - channel (str): Slack channel ID or name (with or without #)
+    - limit (int): Number of messages to inspect (default 50)
+    - user_token (Optional[str]): User's Slack token for multi-user mode
+
+    Returns:
+    - List of action item strings, or None if the channel has no messages
+    """
+    messages = _fetch_channel_messages(channel, limit, user_token)
+    if not messages:
+        return None
+    return extract_action_items(msg.get("text", "") for msg in messages)